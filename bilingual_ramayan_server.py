@@ -3,17 +3,47 @@ Bilingual Ramayan Server - Hindi + English
 Complete server supporting both Ramcharitmanas (Hindi) and Valmiki Ramayana (English)
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, Response
+from pydantic import BaseModel, Field, ValidationError
+from typing import Callable, Dict, Optional
+from contextlib import asynccontextmanager
 import asyncio
+import gzip
+import hashlib
+import json
 import os
+import secrets
 from enhanced_ramayan_chatbot import EnhancedRamayanChatbot
+from request_logging import configure_request_logging, new_request_id, shutdown_request_logging
+import profiling
+
+# Built at startup, not import: index build workers started with spawn re-import this module
+chatbot: Optional[EnhancedRamayanChatbot] = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load the chatbot when the server starts and flush request logs on shutdown"""
+    global chatbot
+    
+    # Environment (.env included) is loaded by now; tracing must precede corpus loading
+    profiling.start_memory_tracing_from_env()
+    
+    # Structured per-request records, written by a background thread
+    configure_request_logging()
+    
+    # Initialize enhanced chatbot
+    chatbot = await asyncio.to_thread(EnhancedRamayanChatbot)
+    try:
+        yield
+    finally:
+        shutdown_request_logging()
 
 app = FastAPI(
     title="🕉️ Bilingual Ramayan AI Chatbot",
-    description="Complete bilingual chatbot supporting Hindi Ramcharitmanas and English Valmiki Ramayana"
+    description="Complete bilingual chatbot supporting Hindi Ramcharitmanas and English Valmiki Ramayana",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -25,16 +55,60 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
-# Initialize enhanced chatbot
-chatbot = EnhancedRamayanChatbot()
-
 class BilingualQuestion(BaseModel):
     question: str
     preferred_language: str = "auto"  # "hindi", "english", or "auto"
+    session_id: Optional[str] = Field(None, max_length=64)  # Enables follow-up questions
+
+class WebSocketQuestion(BilingualQuestion):
+    id: str = Field(..., min_length=1, max_length=64)  # Tags every pushed chunk
 
 class LanguageQuery(BaseModel):
     text: str
 
+class PassageSearch(BaseModel):
+    query: str = ""
+    language: str = "auto"  # "hindi", "english", or "auto"
+    cursor: Optional[str] = Field(None, max_length=128)  # From a previous page's next_cursor
+    page_size: int = Field(10, ge=1, le=50)
+
+class MemoryTracing(BaseModel):
+    frames: int = Field(25, ge=1, le=100)  # Traceback depth kept per allocation
+
+class CpuProfileRequest(BaseModel):
+    calls: int = Field(10, ge=1, le=10000)  # answer_question calls to capture
+    every: int = Field(1, ge=1, le=1000)  # Profile one call in this many
+
+class PrecomputedResponse:
+    """JSON payload encoded once, with a gzip variant and strong ETags"""
+    
+    def __init__(self, payload: Dict, data_version: int):
+        self.data_version = data_version
+        # Same encoding as FastAPI's JSONResponse
+        self.body = json.dumps(
+            payload, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8")
+        self.gzip_body = gzip.compress(self.body, compresslevel=9, mtime=0)
+        digest = hashlib.sha256(self.body).hexdigest()[:32]
+        # Each representation needs its own strong validator
+        self.etag = f'"{digest}"'
+        self.gzip_etag = f'"{digest}-gz"'
+    
+    def matches(self, if_none_match: str) -> bool:
+        """Check an If-None-Match header against either representation"""
+        if if_none_match.strip() == "*":
+            return True
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag.startswith("W/"):
+                tag = tag[2:]
+            if tag in (self.etag, self.gzip_etag):
+                return True
+        return False
+
+# Static GET payloads, rebuilt only when chatbot.data_version changes
+_precomputed: Dict[str, PrecomputedResponse] = {}
+
 @app.get("/")
 async def serve_ui():
     """Main web interface"""
@@ -49,20 +123,23 @@ async def favicon():
 async def ask_bilingual_question(request: BilingualQuestion):
     """Ask question to bilingual Ramayan AI"""
     try:
-        print(f"🌐 Bilingual Question: {request.question}")
-        print(f"🔤 Preferred Language: {request.preferred_language}")
-        
-        # Generate bilingual response
-        answer = await chatbot.generate_response(request.question)
-        
-        # Detect language
-        detected_language = chatbot.detect_language(request.question)
+        # Generate bilingual response off the event loop
+        result = await asyncio.to_thread(
+            chatbot.answer_question,
+            request.question,
+            request.session_id,
+            request_id=new_request_id(),
+            log_fields={"channel": "http", "preferred_language": request.preferred_language}
+        )
         
         return {
             "question": request.question,
-            "answer": answer,
-            "detected_language": detected_language,
+            "answer": result["answer"],
+            "detected_language": result["language"],
+            "answered_by": result["strategy"],
+            "request_id": result["request_id"],
             "preferred_language": request.preferred_language,
+            "session_id": request.session_id,
             "sources": {
                 "hindi": "श्री रामचरितमानस - गोस्वामी तुलसीदास जी",
                 "english": "The Ramayana - Sage Valmiki (Griffith Translation)"
@@ -77,6 +154,102 @@ async def ask_bilingual_question(request: BilingualQuestion):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Per-connection limits for pipelined WebSocket questions
+WS_MAX_CONCURRENT = 4
+WS_MAX_PENDING = 32
+
+def _split_answer(answer: str) -> list:
+    """Split an answer into paragraph chunks that concatenate back to it"""
+    paragraphs = answer.split("\n\n")
+    return [p + "\n\n" for p in paragraphs[:-1]] + [paragraphs[-1]]
+
+@app.websocket("/ws-bilingual")
+async def ws_bilingual(websocket: WebSocket):
+    """Bilingual chat over one connection with pipelined, concurrently answered questions"""
+    await websocket.accept()
+    
+    limit = asyncio.Semaphore(WS_MAX_CONCURRENT)
+    send_lock = asyncio.Lock()
+    pending = set()
+    
+    async def send(message: Dict):
+        async with send_lock:
+            await websocket.send_json(message)
+    
+    async def answer(question: WebSocketQuestion):
+        async with limit:
+            try:
+                # Answering is CPU-bound, worker threads keep the connection responsive
+                result = await asyncio.to_thread(
+                    chatbot.answer_question,
+                    question.question,
+                    question.session_id,
+                    request_id=new_request_id(),
+                    log_fields={"channel": "websocket", "preferred_language": question.preferred_language}
+                )
+                await send({
+                    "id": question.id,
+                    "type": "start",
+                    "detected_language": result["language"],
+                    "answered_by": result["strategy"],
+                    "request_id": result["request_id"],
+                    "session_id": question.session_id
+                })
+                chunks = _split_answer(result["answer"])
+                for index, chunk in enumerate(chunks):
+                    await send({"id": question.id, "type": "chunk", "index": index, "data": chunk})
+                await send({"id": question.id, "type": "done", "chunks": len(chunks)})
+            except WebSocketDisconnect:
+                pass
+            except Exception as e:
+                try:
+                    await send({"id": question.id, "type": "error", "detail": str(e)})
+                except Exception:
+                    # The socket closed while answering, nobody is left to tell
+                    pass
+    
+    try:
+        while True:
+            message_text = await websocket.receive_text()
+            message = None
+            try:
+                message = json.loads(message_text)
+                question = WebSocketQuestion.model_validate(message)
+            except (json.JSONDecodeError, ValidationError) as e:
+                request_id = message.get("id") if isinstance(message, dict) else None
+                await send({"id": request_id, "type": "error", "detail": str(e)})
+                continue
+            
+            if len(pending) >= WS_MAX_PENDING:
+                await send({"id": question.id, "type": "error", "detail": "Too many pending questions"})
+                continue
+            
+            task = asyncio.create_task(answer(question))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in pending:
+            task.cancel()
+
+@app.post("/search-passages")
+async def search_passages(request: PassageSearch):
+    """Page through every full text passage matching a query"""
+    if not request.cursor and not request.query.strip():
+        raise HTTPException(status_code=400, detail="Either query or cursor is required")
+    
+    try:
+        # Ranking a first page scans every match, keep it off the event loop
+        return await asyncio.to_thread(
+            chatbot.search_passages,
+            request.query, request.language, request.cursor, request.page_size
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/detect-language")
 async def detect_language(request: LanguageQuery):
     """Detect language of input text"""
@@ -92,9 +265,78 @@ async def detect_language(request: LanguageQuery):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _get_precomputed(name: str, builder: Callable[[], Dict]) -> PrecomputedResponse:
+    """Return the cached payload for an endpoint, rebuilding it after a reload"""
+    cached = _precomputed.get(name)
+    if cached is None or cached.data_version != chatbot.data_version:
+        cached = PrecomputedResponse(builder(), chatbot.data_version)
+        _precomputed[name] = cached
+    return cached
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q-values"""
+    qualities = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip()] = quality
+    
+    # An explicit gzip entry wins over the wildcard
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+def _serve_precomputed(request: Request, name: str, builder: Callable[[], Dict]) -> Response:
+    """Serve a precomputed payload, honouring If-None-Match and gzip"""
+    cached = _get_precomputed(name, builder)
+    use_gzip = _accepts_gzip(request.headers.get("accept-encoding", ""))
+    headers = {
+        "ETag": cached.gzip_etag if use_gzip else cached.etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding"
+    }
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and cached.matches(if_none_match):
+        return Response(status_code=304, headers=headers)
+    
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=cached.gzip_body, media_type="application/json", headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+# Admin endpoints, only reachable when RAMAYAN_ADMIN_TOKEN is set
+ADMIN_TOKEN = os.getenv("RAMAYAN_ADMIN_TOKEN")
+
+async def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """Allow only requests carrying the admin token"""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+@app.post("/reload-training", dependencies=[Depends(require_admin)])
+async def reload_training():
+    """Reload training data from disk and invalidate precomputed responses"""
+    # Reading and indexing the corpora takes seconds, keep it off the event loop
+    data_version = await asyncio.to_thread(chatbot.reload_training_data)
+    return {"reloaded": True, "data_version": data_version}
+
 @app.get("/training-status")
-async def get_training_status():
+async def get_training_status(request: Request):
     """Get bilingual training data status"""
+    return _serve_precomputed(request, "training-status", _build_training_status)
+
+def _build_training_status() -> Dict:
+    """Build training status payload (stats the training files once)"""
     
     files_status = {}
     
@@ -144,8 +386,12 @@ async def get_training_status():
     }
 
 @app.get("/sample-questions-bilingual")
-async def get_bilingual_sample_questions():
+async def get_bilingual_sample_questions(request: Request):
     """Get sample questions in both languages"""
+    return _serve_precomputed(request, "sample-questions-bilingual", _build_sample_questions)
+
+def _build_sample_questions() -> Dict:
+    """Build sample questions payload"""
     return {
         "hindi_questions": {
             "story_facts": [
@@ -194,8 +440,12 @@ async def get_bilingual_sample_questions():
     }
 
 @app.get("/language-comparison")
-async def get_language_comparison():
+async def get_language_comparison(request: Request):
     """Compare Hindi and English versions"""
+    return _serve_precomputed(request, "language-comparison", _build_language_comparison)
+
+def _build_language_comparison() -> Dict:
+    """Build language comparison payload"""
     return {
         "comparison": {
             "hindi_ramcharitmanas": {
@@ -231,12 +481,16 @@ async def get_language_comparison():
     }
 
 @app.get("/health-bilingual")
-async def health_check_bilingual():
+async def health_check_bilingual(request: Request):
     """Complete bilingual system health check"""
+    return _serve_precomputed(request, "health-bilingual", _build_health)
+
+def _build_health() -> Dict:
+    """Build health payload"""
     
     # Check training data
-    hindi_loaded = bool(chatbot.hindi_data)
-    english_loaded = bool(chatbot.english_data)
+    hindi_loaded = bool(chatbot.corpora.hindi_data)
+    english_loaded = bool(chatbot.corpora.english_data)
     
     # Check files
     hindi_files = os.path.exists("ramcharitmanas_training_data.json")
@@ -269,10 +523,13 @@ async def health_check_bilingual():
         ],
         "api_endpoints": [
             "POST /ask-bilingual - Bilingual questions",
+            "WS /ws-bilingual - Pipelined bilingual questions",
+            "POST /search-passages - Paginated full text search",
             "POST /detect-language - Language detection",
             "GET /training-status - Training data status",
             "GET /sample-questions-bilingual - Sample questions",
-            "GET /language-comparison - Version comparison"
+            "GET /language-comparison - Version comparison",
+            "POST /reload-training - Reload training data (admin)"
         ],
         "total_content": {
             "hindi_pages": 1054,
@@ -282,6 +539,58 @@ async def health_check_bilingual():
         }
     }
 
+# Admin profiling surface
+@app.get("/admin/profile/memory", dependencies=[Depends(require_admin)], include_in_schema=False)
+async def admin_memory_profile(top: int = 10, estimate: bool = True):
+    """Memory attributed to corpora, indexes and caches"""
+    # Walking every traced block takes seconds, keep it off the event loop
+    report = await asyncio.to_thread(profiling.memory_snapshot, top)
+    report["sessions"] = chatbot.sessions.stats()
+    if estimate:
+        report["estimated_bytes"] = await asyncio.to_thread(profiling.component_sizes, chatbot, [_precomputed])
+    return report
+
+@app.post("/admin/profile/memory/start", dependencies=[Depends(require_admin)], include_in_schema=False)
+async def admin_start_memory_tracing(request: MemoryTracing):
+    """Start tracemalloc; only allocations made from now on are attributed"""
+    return {"started": profiling.start_memory_tracing(request.frames)}
+
+@app.post("/admin/profile/memory/stop", dependencies=[Depends(require_admin)], include_in_schema=False)
+async def admin_stop_memory_tracing():
+    """Stop tracemalloc and release its overhead"""
+    return {"stopped": profiling.stop_memory_tracing()}
+
+@app.post("/admin/profile/cpu", dependencies=[Depends(require_admin)], include_in_schema=False)
+async def admin_start_cpu_profile(request: CpuProfileRequest):
+    """Capture cProfile data for the next sampled answer_question calls"""
+    profiling.cpu_profiler.arm(request.calls, request.every)
+    return profiling.cpu_profiler.status()
+
+@app.get("/admin/profile/cpu", dependencies=[Depends(require_admin)], include_in_schema=False)
+async def admin_cpu_profile_status():
+    """Progress of the current CPU capture, with how often each strategy answered"""
+    status = profiling.cpu_profiler.status()
+    status["strategy_counts"] = chatbot.strategy_stats()
+    return status
+
+@app.post("/admin/profile/cpu/stop", dependencies=[Depends(require_admin)], include_in_schema=False)
+async def admin_stop_cpu_profile():
+    """Stop the CPU capture early, keeping the calls profiled so far"""
+    profiling.cpu_profiler.cancel()
+    return profiling.cpu_profiler.status()
+
+@app.get("/admin/profile/cpu/download", dependencies=[Depends(require_admin)], include_in_schema=False)
+async def admin_download_cpu_profile():
+    """Download the captured profile (pstats format, open with pstats or snakeviz)"""
+    result = profiling.cpu_profiler.result()
+    if result is None:
+        raise HTTPException(status_code=404, detail="No completed CPU profile")
+    return Response(
+        content=result,
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": 'attachment; filename="ramayan_answer_question.prof"'}
+    )
+
 if __name__ == "__main__":
     import uvicorn
     print("Starting Bilingual Ramayan AI Server...")
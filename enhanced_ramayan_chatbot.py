@@ -6,24 +6,77 @@ Uses full text search + AI to provide comprehensive answers
 import asyncio
 import json
 import os
-import re
-from typing import Dict, Any, List
+import threading
+from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 import google.generativeai as genai
+from profiling import cpu_profiler
+from query_analyzer import QueryAnalyzer, QueryFeatures
+from ramayan_index import build_indexes
+from request_logging import RequestTrace, log_request
+from search_results import ResultSet, SearchResultStore, decode_cursor, encode_cursor
+from session_store import SessionStore
 
 load_dotenv()
 
+class Corpora:
+    """Training data, full texts and indexes of one load, replaced as a whole on reload"""
+    
+    __slots__ = (
+        "hindi_data", "english_data", "hindi_full_text", "english_full_text",
+        "lines", "analyzer", "indexes", "data_version"
+    )
+    
+    def __init__(self, hindi_data: Dict, english_data: Dict, hindi_full_text: str, english_full_text: str, data_version: int):
+        self.hindi_data = hindi_data
+        self.english_data = english_data
+        self.hindi_full_text = hindi_full_text
+        self.english_full_text = english_full_text
+        self.data_version = data_version
+        
+        # Split once; line numbers double as chunk IDs for sessions
+        self.lines = {
+            "hindi": hindi_full_text.split('\n'),
+            "english": english_full_text.split('\n')
+        }
+        # Keyword tables for single-pass question analysis
+        self.analyzer = QueryAnalyzer(hindi_data, english_data)
+        
+        # Token index over both corpora, built from page shards in parallel
+        self.indexes = build_indexes({"hindi": hindi_full_text, "english": english_full_text})
+
 class EnhancedRamayanChatbot:
     """Enhanced Ramayan chatbot that can answer any question"""
     
+    # Answer strategies, cheapest first, so structured hits never pay for a corpus search.
+    # A follow-up to a passage continues in the text after it; a follow-up to a fact or
+    # character moves on to a related fact before searching the text.
+    STRATEGIES = [
+        ("specific_fact", "_get_specific_answer"),
+        ("character", "_search_characters"),
+        ("teachings", "_search_teachings"),
+        ("session_fact", "_search_session_facts"),
+        ("full_text", "_search_full_text"),
+        ("session_character", "_search_session_characters")
+    ]
+    
+    # Lines after a previous answer searched first for a follow-up question
+    FOLLOW_UP_WINDOW = 200
+    
     def __init__(self):
-        # Load training data - now using fully enhanced data with additional sources
-        self.hindi_data = self._load_training_data("fully_enhanced_training_data.json")
-        self.english_data = self._load_training_data("english_training_data.json")
+        # Requests read one snapshot, a reload swaps in a complete new one
+        self._reload_lock = threading.Lock()
+        self.corpora = self._load_corpora(data_version=1)
+        
+        # Conversational state for optional session IDs
+        self.sessions = SessionStore()
+        
+        # Ranked full text matches behind pagination cursors
+        self.search_results = SearchResultStore()
         
-        # Load full text if available
-        self.hindi_full_text = self._load_full_text("रामचरितमानस_extracted.txt")
-        self.english_full_text = self._load_full_text("english_extracted.txt")
+        # How often each strategy answered, reported to admins with the CPU profile status
+        self.strategy_counts: Dict[str, int] = {}
+        self._strategy_lock = threading.Lock()
         
         # API setup
         self.has_real_keys = (
@@ -38,6 +91,30 @@ class EnhancedRamayanChatbot:
             self.model = None
             print("⚠️  Demo mode - For full AI capabilities, add GEMINI_API_KEY to .env")
     
+    def _load_corpora(self, data_version: int) -> Corpora:
+        """Load structured training data and full text corpora"""
+        return Corpora(
+            # Load training data - now using fully enhanced data with additional sources
+            self._load_training_data("fully_enhanced_training_data.json"),
+            self._load_training_data("english_training_data.json"),
+            # Load full text if available
+            self._load_full_text("रामचरितमानस_extracted.txt"),
+            self._load_full_text("english_extracted.txt"),
+            data_version
+        )
+    
+    def reload_training_data(self) -> int:
+        """Reload training data from disk and return the new data version"""
+        with self._reload_lock:
+            # Requests keep answering from the current corpora until the swap
+            self.corpora = self._load_corpora(self.corpora.data_version + 1)
+            return self.corpora.data_version
+    
+    @property
+    def data_version(self) -> int:
+        """Bumped on every reload so callers can invalidate derived caches"""
+        return self.corpora.data_version
+    
     def _load_training_data(self, filename: str) -> Dict:
         """Load training data from JSON file"""
         try:
@@ -71,71 +148,86 @@ class EnhancedRamayanChatbot:
         else:
             return "english"
     
-    def search_content(self, question: str, language: str) -> Dict:
-        """Search for relevant content using multiple methods"""
-        
-        # Method 1: Check specific story facts (highest priority)
-        specific_answer = self._get_specific_answer(question, language)
-        if specific_answer:
-            return specific_answer
-        
-        # Method 2: Search in full text content
-        text_search_result = self._search_full_text(question, language)
-        if text_search_result:
-            return text_search_result
-        
-        # Method 3: Character and theme matching
-        character_result = self._search_characters_themes(question, language)
-        if character_result:
-            return character_result
-        
-        # Method 4: Generate AI response with context
-        return self._generate_contextual_response(question, language)
+    def route(self, corpora: Corpora, features: QueryFeatures, trace: Optional[RequestTrace] = None) -> Dict:
+        """Try answer strategies in cost order and record which one answered"""
+        trace = trace or RequestTrace()
+        for strategy, method_name in self.STRATEGIES:
+            with trace.stage(strategy):
+                result = getattr(self, method_name)(corpora, features)
+            if result:
+                break
+        else:
+            # Generate AI response with context
+            strategy = "contextual"
+            with trace.stage(strategy):
+                result = self._generate_contextual_response(corpora, features.question, features.language)
+        
+        result["strategy"] = strategy
+        with self._strategy_lock:
+            self.strategy_counts[strategy] = self.strategy_counts.get(strategy, 0) + 1
+        return result
     
-    def _get_specific_answer(self, question: str, language: str) -> Dict:
+    def strategy_stats(self) -> Dict[str, int]:
+        """Answers given by each strategy since startup"""
+        with self._strategy_lock:
+            return dict(self.strategy_counts)
+    
+    def _get_specific_answer(self, corpora: Corpora, features: QueryFeatures) -> Dict:
         """Check for specific pre-programmed answers"""
-        question_lower = question.lower()
+        return self._fact_result(corpora, features, features.fact_ids)
+    
+    def _search_session_facts(self, corpora: Corpora, features: QueryFeatures) -> Dict:
+        """Answer a follow-up to a structured answer with a related fact not yet given"""
+        if not features.follow_up or features.follow_up.chunk_ids:
+            return None
+        return self._fact_result(corpora, features, corpora.analyzer.related_fact_ids(features))
+    
+    def _fact_result(self, corpora: Corpora, features: QueryFeatures, fact_ids: List[str]) -> Dict:
+        """Story fact answer for the first of the given fact IDs"""
+        if not fact_ids:
+            return None
         
-        if language == "hindi":
-            data_source = self.hindi_data
-            story_facts_key = "story_facts"
+        if features.language == "hindi":
+            story_facts = corpora.hindi_data.get("story_facts", {})
         else:
-            data_source = self.english_data
-            story_facts_key = "english_story_facts"
-        
-        # Check story facts
-        for fact_key, fact_data in data_source.get(story_facts_key, {}).items():
-            keywords = fact_data.get("question_keywords", []) or fact_data.get("keywords", [])
-            for keyword in keywords:
-                if keyword.lower() in question_lower:
-                    return {
-                        "type": "specific_fact",
-                        "language": language,
-                        "answer": fact_data.get("answer") or fact_data.get("content"),
-                        "source": "Structured Knowledge Base"
-                    }
+            story_facts = corpora.english_data.get("english_story_facts", {})
         
-        return None
+        # Earliest fact in the knowledge base wins
+        fact_key = fact_ids[0]
+        fact_data = story_facts[fact_key]
+        return {
+            "type": "specific_fact",
+            "language": features.language,
+            "answer": fact_data.get("answer") or fact_data.get("content"),
+            "source": "Structured Knowledge Base",
+            "fact_id": fact_key
+        }
     
-    def _search_full_text(self, question: str, language: str) -> Dict:
+    def _search_full_text(self, corpora: Corpora, features: QueryFeatures) -> Dict:
         """Search in full text content"""
-        if language == "hindi" and self.hindi_full_text:
-            text_content = self.hindi_full_text
+        language = features.language
+        if language == "hindi" and corpora.hindi_full_text:
             source = "Ramcharitmanas Full Text"
-        elif language == "english" and self.english_full_text:
-            text_content = self.english_full_text
+        elif language == "english" and corpora.english_full_text:
             source = "Valmiki Ramayana Full Text"
         else:
             return None
+        lines = corpora.lines[language]
         
-        # Extract key terms from question
-        key_terms = self._extract_key_terms(question, language)
+        if features.follow_up:
+            key_terms = list(features.follow_up.entities)
+            # Narrow to the text just after the previous answer before rescanning everything
+            line_ids = self._follow_up_line_ids(features.follow_up.chunk_ids, len(lines))
+        else:
+            # The question's own terms rank first, earlier entities add context
+            key_terms = features.key_terms + features.session_terms
+            line_ids = None
         
-        # Search for relevant passages
-        relevant_passages = []
-        for term in key_terms:
-            passages = self._find_passages_with_term(text_content, term)
-            relevant_passages.extend(passages)
+        # Search for relevant passages, counting term cache hits for the request log
+        lookups = {"hits": 0, "misses": 0}
+        relevant_passages, chunk_ids = self._collect_passages(corpora, language, key_terms, line_ids, lookups)
+        if not relevant_passages and line_ids is not None:
+            relevant_passages, chunk_ids = self._collect_passages(corpora, language, key_terms, None, lookups)
         
         if relevant_passages:
             # Combine and summarize passages
@@ -145,96 +237,178 @@ class EnhancedRamayanChatbot:
                 "language": language,
                 "passages": combined_text[:1000],  # Limit length
                 "source": source,
-                "key_terms": key_terms
+                "key_terms": key_terms,
+                "chunk_ids": chunk_ids[:3],
+                "cache_lookups": lookups
             }
         
         return None
     
-    def _extract_key_terms(self, question: str, language: str) -> List[str]:
-        """Extract key terms from question for searching"""
-        question_lower = question.lower()
-        
-        if language == "hindi":
-            # Hindi key terms
-            key_terms = []
-            hindi_names = ["राम", "सीता", "हनुमान", "रावण", "लक्ष्मण", "भरत", "दशरथ", "कैकेयी", "कौशल्या"]
-            hindi_places = ["अयोध्या", "लंका", "चित्रकूट", "पंचवटी", "किष्किंधा"]
-            hindi_events = ["जन्म", "विवाह", "वनवास", "युद्ध", "वध", "मिलाप"]
-            
-            all_terms = hindi_names + hindi_places + hindi_events
-            for term in all_terms:
-                if term in question_lower:
-                    key_terms.append(term)
+    def _collect_passages(self, corpora: Corpora, language: str, key_terms: List[str], line_ids: Optional[List[int]], lookups: Optional[Dict[str, int]] = None):
+        """Collect passages and their matched line numbers for all key terms"""
+        lines = corpora.lines[language]
+        relevant_passages = []
+        chunk_ids = []
+        for term in key_terms:
+            for line_id in self._find_lines_with_term(corpora, language, term, line_ids, lookups=lookups):
+                relevant_passages.append(self._passage_at(lines, line_id))
+                chunk_ids.append(line_id)
+        return relevant_passages, chunk_ids
+    
+    def _follow_up_line_ids(self, chunk_ids: List[int], line_count: int) -> List[int]:
+        """Line numbers following the previously matched chunks"""
+        line_ids = set()
+        for chunk_id in chunk_ids:
+            # Skip the passage already shown around the chunk
+            start = chunk_id + 3
+            line_ids.update(range(start, min(line_count, start + self.FOLLOW_UP_WINDOW)))
+        return sorted(line_ids)
+    
+    def _find_lines_with_term(self, corpora: Corpora, language: str, term: str, line_ids: Optional[List[int]] = None, limit: Optional[int] = 5, lookups: Optional[Dict[str, int]] = None) -> List[int]:
+        """Find line numbers containing the search term, optionally within given sorted lines
+        
+        When lookups is given, the term is counted there as a cache hit or miss.
+        """
+        indexed, cached = corpora.indexes[language].lookup(term)
+        if lookups is not None:
+            # A scan for a term the index cannot answer is never cached
+            lookups["hits" if cached and indexed is not None else "misses"] += 1
+        if indexed is not None:
+            if line_ids is not None:
+                allowed = set(line_ids)
+                indexed = [i for i in indexed if i in allowed]
+            return list(indexed[:limit])  # Return top 5 passages by default
+        
+        # Terms the index cannot answer fall back to a scan
+        lines = corpora.lines[language]
+        term_lower = term.lower()
+        if line_ids is None:
+            line_ids = range(len(lines))
+        
+        matches = []
+        for i in line_ids:
+            if term_lower in lines[i].lower():
+                matches.append(i)
+                if len(matches) == limit:
+                    break
+        return matches
+    
+    def search_passages(self, query: str = "", language: str = "auto", cursor: Optional[str] = None, page_size: int = 10) -> Dict:
+        """Return one ranked page of all full text passages matching the query
+        
+        The first call ranks every match once and stores the result set; the
+        returned cursor serves later pages from it until it expires.
+        """
+        corpora = self.corpora
+        if cursor:
+            result_id, offset = decode_cursor(cursor)
+            result_set = self.search_results.get(result_id)
+            if result_set is None or result_set.data_version != corpora.data_version:
+                raise ValueError("Cursor expired, please search again")
         else:
-            # English key terms
-            key_terms = []
-            english_names = ["rama", "sita", "hanuman", "ravana", "lakshmana", "bharata", "dasharatha"]
-            english_places = ["ayodhya", "lanka", "chitrakuta", "panchavati", "kishkindha"]
-            english_events = ["birth", "marriage", "exile", "war", "death", "meeting"]
-            
-            all_terms = english_names + english_places + english_events
-            for term in all_terms:
-                if term in question_lower:
-                    key_terms.append(term)
-        
-        # If no specific terms found, extract nouns
-        if not key_terms:
-            words = re.findall(r'\b\w+\b', question_lower)
-            key_terms = [word for word in words if len(word) > 3][:3]
+            if language not in ("hindi", "english"):
+                language = self.detect_language(query)
+            key_terms = corpora.analyzer.analyze(query, language).key_terms
+            ranked = self._rank_passages(corpora, language, key_terms)
+            result_set = ResultSet(language, key_terms, ranked, corpora.data_version)
+            result_id = self.search_results.add(result_set)
+            offset = 0
+        
+        lines = corpora.lines[result_set.language]
+        end = min(offset + page_size, len(result_set.line_ids))
+        passages = []
+        for position in range(offset, end):
+            line_id = result_set.line_ids[position]
+            passages.append({
+                "rank": position + 1,
+                "line": line_id,
+                "score": result_set.scores[position],
+                "text": self._passage_at(lines, line_id)
+            })
         
-        return key_terms
+        return {
+            "language": result_set.language,
+            "key_terms": result_set.key_terms,
+            "total": len(result_set.line_ids),
+            "passages": passages,
+            "next_cursor": encode_cursor(result_id, end) if end < len(result_set.line_ids) else None
+        }
     
-    def _find_passages_with_term(self, text: str, term: str) -> List[str]:
-        """Find passages containing the search term"""
-        passages = []
-        lines = text.split('\n')
+    def _rank_passages(self, corpora: Corpora, language: str, key_terms: List[str]) -> List[tuple]:
+        """Rank matching lines by how many key terms their passage contains"""
+        term_lines = [set(self._find_lines_with_term(corpora, language, term, limit=None)) for term in key_terms]
+        candidates = set().union(*term_lines)
+        
+        scored = []
+        for line_id in candidates:
+            # Passages span two lines either side of the match
+            score = sum(
+                1 for matches in term_lines
+                if any(line_id + delta in matches for delta in range(-2, 3))
+            )
+            scored.append((line_id, score))
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        
+        # Skip matches already shown inside a better ranked passage
+        ranked = []
+        covered = set()
+        for line_id, score in scored:
+            if line_id in covered:
+                continue
+            ranked.append((line_id, score))
+            covered.update(range(line_id - 2, line_id + 3))
+        return ranked
+    
+    def _passage_at(self, lines: List[str], line_id: int) -> str:
+        """Get context around a matching line"""
+        start = max(0, line_id - 2)
+        end = min(len(lines), line_id + 3)
+        return '\n'.join(lines[start:end])
+    
+    def _search_characters(self, corpora: Corpora, features: QueryFeatures) -> Dict:
+        """Answer from the character database for a character named in the question"""
+        return self._character_result(corpora, features, features.characters)
+    
+    def _search_session_characters(self, corpora: Corpora, features: QueryFeatures) -> Dict:
+        """Answer a follow-up from the characters discussed earlier in the session"""
+        return self._character_result(corpora, features, corpora.analyzer.session_characters(features))
+    
+    def _character_result(self, corpora: Corpora, features: QueryFeatures, names: List[str]) -> Dict:
+        """Character information for the first of the given names"""
+        if not names:
+            return None
         
-        for i, line in enumerate(lines):
-            if term.lower() in line.lower():
-                # Get context around the matching line
-                start = max(0, i - 2)
-                end = min(len(lines), i + 3)
-                passage = '\n'.join(lines[start:end])
-                passages.append(passage)
+        if features.language == "hindi":
+            characters = corpora.hindi_data.get("characters", {})
+        else:
+            characters = corpora.english_data.get("characters_english", {})
         
-        return passages[:5]  # Return top 5 passages
+        return {
+            "type": "character_info",
+            "language": features.language,
+            "character": names[0],
+            "data": characters[names[0]],
+            "source": "Character Database"
+        }
     
-    def _search_characters_themes(self, question: str, language: str) -> Dict:
-        """Search for character and theme information"""
-        question_lower = question.lower()
+    def _search_teachings(self, corpora: Corpora, features: QueryFeatures) -> Dict:
+        """Answer from the spiritual teachings when the question asks for them"""
+        if not features.teaching_keywords:
+            return None
         
-        if language == "hindi":
-            data_source = self.hindi_data
-            characters_key = "characters"
-        else:
-            data_source = self.english_data
-            characters_key = "characters_english"
-        
-        # Check characters
-        for char_name, char_data in data_source.get(characters_key, {}).items():
-            if char_name.lower() in question_lower:
-                return {
-                    "type": "character_info",
-                    "language": language,
-                    "character": char_name,
-                    "data": char_data,
-                    "source": "Character Database"
-                }
-        
-        # Check themes/teachings
-        if "teaching" in question_lower or "lesson" in question_lower or "dharma" in question_lower:
-            teachings = data_source.get("teachings", {})
-            if teachings:
-                return {
-                    "type": "teachings",
-                    "language": language,
-                    "data": teachings,
-                    "source": "Spiritual Teachings"
-                }
+        data_source = corpora.hindi_data if features.language == "hindi" else corpora.english_data
+        teachings = data_source.get("teachings", {})
+        if teachings:
+            return {
+                "type": "teachings",
+                "language": features.language,
+                "data": teachings,
+                "source": "Spiritual Teachings"
+            }
         
         return None
     
-    def _generate_contextual_response(self, question: str, language: str) -> Dict:
+    def _generate_contextual_response(self, corpora: Corpora, question: str, language: str) -> Dict:
         """Generate response using available context"""
         
         # Create a comprehensive context from available data
@@ -243,17 +417,17 @@ class EnhancedRamayanChatbot:
         if language == "hindi":
             # Add Hindi context
             context_parts.append("रामचरितमानस से संदर्भ:")
-            if self.hindi_data.get("story_facts"):
-                context_parts.append("मुख्य कथाएं: " + ", ".join(self.hindi_data["story_facts"].keys()))
-            if self.hindi_data.get("characters"):
-                context_parts.append("मुख्य पात्र: " + ", ".join(self.hindi_data["characters"].keys()))
+            if corpora.hindi_data.get("story_facts"):
+                context_parts.append("मुख्य कथाएं: " + ", ".join(corpora.hindi_data["story_facts"].keys()))
+            if corpora.hindi_data.get("characters"):
+                context_parts.append("मुख्य पात्र: " + ", ".join(corpora.hindi_data["characters"].keys()))
         else:
             # Add English context
             context_parts.append("From Valmiki Ramayana:")
-            if self.english_data.get("english_story_facts"):
-                context_parts.append("Main stories: " + ", ".join(self.english_data["english_story_facts"].keys()))
-            if self.english_data.get("characters_english"):
-                context_parts.append("Main characters: " + ", ".join(self.english_data["characters_english"].keys()))
+            if corpora.english_data.get("english_story_facts"):
+                context_parts.append("Main stories: " + ", ".join(corpora.english_data["english_story_facts"].keys()))
+            if corpora.english_data.get("characters_english"):
+                context_parts.append("Main characters: " + ", ".join(corpora.english_data["characters_english"].keys()))
         
         context = "\n".join(context_parts)
         
@@ -265,27 +439,86 @@ class EnhancedRamayanChatbot:
             "source": "AI Generated with Context"
         }
     
-    async def generate_response(self, question: str) -> str:
+    async def generate_response(self, question: str, session_id: Optional[str] = None) -> str:
         """Generate comprehensive response for any Ramayana question"""
+        result = await asyncio.to_thread(self.answer_question, question, session_id)
+        return result["answer"]
+    
+    @cpu_profiler.profiled
+    def answer_question(self, question: str, session_id: Optional[str] = None, request_id: Optional[str] = None, log_fields: Optional[Dict] = None) -> Dict:
+        """Answer a question, reporting the detected language and answering strategy
+        
+        CPU-bound and blocking; async callers run it in a worker thread.
+        """
+        trace = RequestTrace(request_id, **(log_fields or {}))
         
         # Detect language
-        language = self.detect_language(question)
-        print(f"🔍 Detected language: {language}")
+        with trace.stage("detect_language"):
+            language = self.detect_language(question)
         
-        # Search for relevant content
-        content = self.search_content(question, language)
+        # One snapshot for the whole request, even if a reload swaps it meanwhile
+        corpora = self.corpora
         
-        # Generate response based on content type
-        if content["type"] == "specific_fact":
-            return self._format_specific_answer(content, question)
-        elif content["type"] == "text_search":
-            return self._format_text_search_answer(content, question)
-        elif content["type"] == "character_info":
-            return self._format_character_answer(content, question)
-        elif content["type"] == "teachings":
-            return self._format_teachings_answer(content, question)
+        # Analyze the question once, then route it to the cheapest answering strategy
+        with trace.stage("analyze"):
+            session = self.sessions.get(session_id) if session_id else None
+            features = corpora.analyzer.analyze(question, language, session)
+        
+        content = self.route(corpora, features, trace)
+        
+        # A full text answer is a cache hit when every one of its term lookups was
+        lookups = content.get("cache_lookups")
+        if lookups and (lookups["hits"] or lookups["misses"]):
+            cache_hit = lookups["misses"] == 0
         else:
-            return self._format_contextual_answer(content, question)
+            cache_hit = None
+        
+        if session_id:
+            self._remember(session_id, features, content)
+        
+        # Generate response based on content type
+        with trace.stage("format"):
+            if content["type"] == "specific_fact":
+                answer = self._format_specific_answer(content, question)
+            elif content["type"] == "text_search":
+                answer = self._format_text_search_answer(content, question)
+            elif content["type"] == "character_info":
+                answer = self._format_character_answer(content, question)
+            elif content["type"] == "teachings":
+                answer = self._format_teachings_answer(content, question)
+            else:
+                answer = self._format_contextual_answer(content, question)
+        
+        trace.fields.update(
+            language=language,
+            stage=content["strategy"],
+            cache_hit=cache_hit,
+            session=session_id is not None,
+            follow_up=features.follow_up is not None
+        )
+        log_request(trace)
+        
+        return {
+            "answer": answer,
+            "language": language,
+            "strategy": content["strategy"],
+            "request_id": trace.request_id
+        }
+    
+    def _remember(self, session_id: str, features: QueryFeatures, content: Dict):
+        """Store the entities and matches of this answer for follow-up questions"""
+        entities = list(features.entities)
+        if content["type"] == "character_info":
+            entities.append(content["character"].lower())
+        
+        fact_ids = [content["fact_id"]] if "fact_id" in content else []
+        self.sessions.update(
+            session_id,
+            features.language,
+            entities=entities,
+            fact_ids=fact_ids,
+            chunk_ids=content.get("chunk_ids", [])
+        )
     
     def _format_specific_answer(self, content: Dict, question: str) -> str:
         """Format specific fact answer"""
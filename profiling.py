@@ -0,0 +1,298 @@
+"""
+Profiling Hooks
+On-demand memory attribution and sampled CPU profiles, idle unless armed
+"""
+
+import cProfile
+import functools
+import inspect
+import marshal
+import os
+import sys
+import threading
+import tracemalloc
+import types
+from typing import Dict, Iterable, Optional
+
+# Allocation sites mapped to the component that owns the memory
+COMPONENT_FILES = {
+    "ramayan_index.py": "indexes",
+    "query_analyzer.py": "indexes",
+    "session_store.py": "caches",
+    "search_results.py": "caches"
+}
+
+# Functions whose allocations belong to a component other than their file's:
+# corpus loading, and caches filled from index and server code
+COMPONENT_FUNCTIONS = {
+    ("enhanced_ramayan_chatbot", "EnhancedRamayanChatbot._load_training_data"): "corpora",
+    ("enhanced_ramayan_chatbot", "EnhancedRamayanChatbot._load_full_text"): "corpora",
+    ("enhanced_ramayan_chatbot", "EnhancedRamayanChatbot._load_corpora"): "corpora",
+    ("ramayan_index", "FullTextIndex.lookup"): "caches",
+    ("ramayan_index", "FullTextIndex._lines_with_term"): "caches",
+    ("bilingual_ramayan_server", "_get_precomputed"): "caches"
+}
+
+# Postings built by index workers are unpickled in the process pool's result thread,
+# whose frames never reach ramayan_index.py; the index build is the only pool user
+COMPONENT_PATHS = {
+    os.path.join("concurrent", "futures", "process.py"): "indexes"
+}
+
+
+def _component_of(traceback: tracemalloc.Traceback, function_lines: Dict[tuple, str]) -> str:
+    """Component of the innermost frame belonging to a known allocation site"""
+    for frame in reversed(traceback):
+        filename = os.path.basename(frame.filename)
+        component = function_lines.get((filename, frame.lineno))
+        if component:
+            return component
+        if filename in COMPONENT_FILES:
+            return COMPONENT_FILES[filename]
+        for path, component in COMPONENT_PATHS.items():
+            if frame.filename.endswith(path):
+                return component
+    return "other"
+
+
+def _function_lines() -> Dict[tuple, str]:
+    """(filename, line) pairs inside COMPONENT_FUNCTIONS, mapped to their component"""
+    # Frames carry no function names, so match the functions' line ranges
+    lines = {}
+    for (module_name, qualname), component in COMPONENT_FUNCTIONS.items():
+        module = _loaded_module(module_name)
+        if module is None:
+            continue
+        func = module
+        for attribute in qualname.split("."):
+            func = getattr(func, attribute)
+        source, first_line = inspect.getsourcelines(func)
+        filename = os.path.basename(inspect.getsourcefile(func))
+        lines.update(((filename, first_line + offset), component) for offset in range(len(source)))
+    return lines
+
+
+def _loaded_module(name: str) -> Optional[types.ModuleType]:
+    """An imported module, including one run as the main script"""
+    module = sys.modules.get(name)
+    if module is None:
+        main = sys.modules.get("__main__")
+        if os.path.basename(getattr(main, "__file__", None) or "") == name + ".py":
+            module = main
+    return module
+
+
+def start_memory_tracing(frames: int = 25) -> bool:
+    """Start tracemalloc, returning False if it was already tracing"""
+    if tracemalloc.is_tracing():
+        return False
+    tracemalloc.start(frames)
+    return True
+
+
+def start_memory_tracing_from_env() -> bool:
+    """Start tracemalloc if RAMAYAN_TRACEMALLOC=1
+
+    Called at server startup, after .env is loaded and before the corpora
+    and indexes are, so their allocations are attributed as well.
+    """
+    if os.getenv("RAMAYAN_TRACEMALLOC") != "1":
+        return False
+    return start_memory_tracing(int(os.getenv("RAMAYAN_TRACEMALLOC_FRAMES", "25")))
+
+
+def stop_memory_tracing() -> bool:
+    """Stop tracemalloc and free its traces, returning False if it was not tracing"""
+    if not tracemalloc.is_tracing():
+        return False
+    tracemalloc.stop()
+    return True
+
+
+def memory_snapshot(top: int = 10) -> Dict:
+    """Traced memory grouped by component, plus the largest allocation sites"""
+    if not tracemalloc.is_tracing():
+        return {"tracing": False}
+
+    # Filtering traces in Python costs more than the grouping, so none is applied
+    snapshot = tracemalloc.take_snapshot()
+
+    # Identical tracebacks are grouped, so each allocation site is classified once
+    function_lines = _function_lines()
+    components: Dict[str, Dict[str, int]] = {}
+    for stat in snapshot.statistics("traceback"):
+        component = components.setdefault(_component_of(stat.traceback, function_lines), {"bytes": 0, "blocks": 0})
+        component["bytes"] += stat.size
+        component["blocks"] += stat.count
+
+    top_sites = [
+        {
+            "site": f"{os.path.basename(stat.traceback[-1].filename)}:{stat.traceback[-1].lineno}",
+            "bytes": stat.size,
+            "blocks": stat.count
+        }
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+
+    current, peak = tracemalloc.get_traced_memory()
+    return {
+        "tracing": True,
+        "traceback_frames": tracemalloc.get_traceback_limit(),
+        "traced_bytes": current,
+        "peak_traced_bytes": peak,
+        "components": components,
+        "top_sites": top_sites
+    }
+
+
+def deep_size(obj, seen: Optional[set] = None) -> int:
+    """Approximate bytes reachable from obj through containers and slots"""
+    if seen is None:
+        seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, (type, types.ModuleType, types.FunctionType, types.MethodType)):
+            continue
+        size += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif hasattr(current, "__dict__"):
+            stack.append(current.__dict__)
+        elif hasattr(current, "__slots__"):
+            stack.extend(getattr(current, slot) for slot in current.__slots__ if hasattr(current, slot))
+    return size
+
+
+def component_sizes(chatbot, caches: Iterable = ()) -> Dict[str, int]:
+    """Estimated size of the chatbot's corpora, indexes and caches, without tracing
+
+    Extra cache roots held outside the chatbot (such as precomputed
+    responses) are passed in caches.
+    """
+    corpora = chatbot.corpora
+    term_caches = [index.cache for index in corpora.indexes.values()]
+    components = {
+        "corpora": [
+            corpora.hindi_data, corpora.english_data,
+            corpora.hindi_full_text, corpora.english_full_text,
+            corpora.lines
+        ],
+        "indexes": [corpora.indexes, corpora.analyzer],
+        "caches": [chatbot.sessions, chatbot.search_results] + term_caches + list(caches)
+    }
+    # Shared objects are counted once, by the first component that reaches them.
+    # Term caches hang off the indexes, so they are skipped until the caches are walked.
+    seen = {id(cache) for cache in term_caches}
+    sizes = {}
+    for name, roots in components.items():
+        if name == "caches":
+            seen.difference_update(id(cache) for cache in term_caches)
+        sizes[name] = sum(deep_size(root, seen) for root in roots)
+    return sizes
+
+
+class CallProfiler:
+    """cProfile capture of a chosen number of calls to a decorated function"""
+
+    def __init__(self):
+        self.remaining = 0
+        self.every = 1
+        self.captured = 0
+        self._seen = 0
+        self._profile: Optional[cProfile.Profile] = None
+        self._result: Optional[bytes] = None
+        self._busy = False
+        self._lock = threading.Lock()
+
+    def arm(self, calls: int, every: int = 1):
+        """Profile the next `calls` sampled calls, sampling one call in `every`"""
+        with self._lock:
+            self.remaining = calls
+            self.every = max(1, every)
+            self.captured = 0
+            self._seen = 0
+            self._profile = cProfile.Profile()
+            self._result = None
+
+    def cancel(self):
+        """Stop capturing, keeping what was profiled so far"""
+        with self._lock:
+            self.remaining = 0
+            self._finish()
+
+    def status(self) -> Dict:
+        return {
+            "armed": self.remaining > 0,
+            "remaining_calls": self.remaining,
+            "sample_every": self.every,
+            "captured_calls": self.captured,
+            "result_available": self._result is not None
+        }
+
+    def result(self) -> Optional[bytes]:
+        """Captured profile in the marshalled pstats format read by pstats and snakeviz"""
+        return self._result
+
+    def profiled(self, func):
+        """Decorate a function whose calls can be captured, in whichever thread runs them"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # The only cost while disarmed
+            if not self.remaining:
+                return func(*args, **kwargs)
+
+            profile = self._claim()
+            if profile is None:
+                return func(*args, **kwargs)
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiler is active in this thread
+                self._release(captured=False)
+                return func(*args, **kwargs)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profile.disable()
+                self._release()
+        return wrapper
+
+    def _claim(self) -> Optional[cProfile.Profile]:
+        """Decide whether this call is sampled; one profiled call runs at a time"""
+        with self._lock:
+            if not self.remaining or self._busy:
+                return None
+            self._seen += 1
+            if (self._seen - 1) % self.every:
+                return None
+            self._busy = True
+            return self._profile
+
+    def _release(self, captured: bool = True):
+        with self._lock:
+            self._busy = False
+            if not captured:
+                return
+            self.captured += 1
+            self.remaining = max(0, self.remaining - 1)
+            if not self.remaining:
+                self._finish()
+
+    def _finish(self):
+        if self._profile is not None and self.captured:
+            self._profile.create_stats()
+            self._result = marshal.dumps(self._profile.stats)
+        self._profile = None
+
+
+# Wraps EnhancedRamayanChatbot.answer_question, which generate_response calls
+cpu_profiler = CallProfiler()
@@ -0,0 +1,144 @@
+"""
+Query Analyzer
+Computes every feature the answer strategies need in one pass over a question
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from session_store import SessionState
+
+# Key terms recognised in questions
+HINDI_NAMES = ["राम", "सीता", "हनुमान", "रावण", "लक्ष्मण", "भरत", "दशरथ", "कैकेयी", "कौशल्या"]
+HINDI_PLACES = ["अयोध्या", "लंका", "चित्रकूट", "पंचवटी", "किष्किंधा"]
+HINDI_EVENTS = ["जन्म", "विवाह", "वनवास", "युद्ध", "वध", "मिलाप"]
+ENGLISH_NAMES = ["rama", "sita", "hanuman", "ravana", "lakshmana", "bharata", "dasharatha"]
+ENGLISH_PLACES = ["ayodhya", "lanka", "chitrakuta", "panchavati", "kishkindha"]
+ENGLISH_EVENTS = ["birth", "marriage", "exile", "war", "death", "meeting"]
+
+# Words that ask for the teachings section
+TEACHING_KEYWORDS = ["teaching", "lesson", "dharma"]
+
+# Pronouns and sequence words that refer back to the previous answer
+FOLLOW_UP_WORDS = {
+    "hindi": {
+        "वह", "वे", "उसने", "उसे", "उसको", "उसका", "उसकी", "उसके", "उन्होंने", "उन्हें",
+        "उनको", "उनका", "उनकी", "उनके", "फिर", "आगे", "बाद", "वहाँ", "वहां"
+    },
+    "english": {
+        "he", "she", "him", "her", "his", "hers", "they", "them", "their", "it", "its",
+        "next", "then", "after", "afterwards", "later", "there"
+    }
+}
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
+# \w stops at Devanagari vowel signs, so whole words are split on spaces and punctuation
+WHOLE_WORD_SPLIT = re.compile(r'[\s?!.,;:।॥"\'()]+')
+
+
+class QueryFeatures:
+    """Everything known about one question before any answer strategy runs"""
+
+    __slots__ = (
+        "question", "language", "question_lower", "tokens", "entities", "key_terms",
+        "session_terms", "fact_ids", "characters", "teaching_keywords", "follow_up"
+    )
+
+    def __init__(self, question: str, language: str):
+        self.question = question
+        self.language = language
+        self.question_lower = question.lower()
+        self.tokens: List[str] = []
+        self.entities: List[str] = []             # Known names, places and events
+        self.key_terms: List[str] = []            # Entities, else the longer words
+        self.session_terms: List[str] = []        # Session entities searched after the key terms
+        self.fact_ids: List[str] = []             # Story facts whose keywords matched
+        self.characters: List[str] = []           # Character database entries named
+        self.teaching_keywords: List[str] = []
+        self.follow_up: Optional[SessionState] = None  # Session reused by a follow-up
+
+
+class QueryAnalyzer:
+    """Keyword tables prepared once per training data load"""
+
+    def __init__(self, hindi_data: Dict, english_data: Dict):
+        self.entity_terms = {
+            "hindi": HINDI_NAMES + HINDI_PLACES + HINDI_EVENTS,
+            "english": ENGLISH_NAMES + ENGLISH_PLACES + ENGLISH_EVENTS
+        }
+
+        # (fact ID, lowercased keywords) in knowledge base order
+        self.fact_keywords = {
+            "hindi": self._fact_keywords(hindi_data.get("story_facts", {})),
+            "english": self._fact_keywords(english_data.get("english_story_facts", {}))
+        }
+
+        # (character name, lowercased name) in database order
+        self.character_names = {
+            "hindi": [(name, name.lower()) for name in hindi_data.get("characters", {})],
+            "english": [(name, name.lower()) for name in english_data.get("characters_english", {})]
+        }
+
+    def _fact_keywords(self, story_facts: Dict) -> List[tuple]:
+        table = []
+        for fact_key, fact_data in story_facts.items():
+            keywords = fact_data.get("question_keywords", []) or fact_data.get("keywords", [])
+            table.append((fact_key, [keyword.lower() for keyword in keywords]))
+        return table
+
+    def analyze(self, question: str, language: str, session: Optional[SessionState] = None) -> QueryFeatures:
+        """Lowercase and scan the question once, collecting all features"""
+        features = QueryFeatures(question, language)
+        text = features.question_lower
+
+        features.tokens = WORD_PATTERN.findall(text)
+        features.entities = [term for term in self.entity_terms[language] if term in text]
+
+        # If no specific terms found, fall back to the longer words
+        if features.entities:
+            features.key_terms = list(features.entities)
+        else:
+            features.key_terms = [word for word in features.tokens if len(word) > 3][:3]
+
+        features.fact_ids = [
+            fact_key for fact_key, keywords in self.fact_keywords[language]
+            if any(keyword in text for keyword in keywords)
+        ]
+        features.characters = [
+            name for name, name_lower in self.character_names[language] if name_lower in text
+        ]
+        features.teaching_keywords = [keyword for keyword in TEACHING_KEYWORDS if keyword in text]
+
+        if session and session.entities:
+            # Follow-ups ("what did he do next?") refer back without naming an entity
+            words = set(WHOLE_WORD_SPLIT.split(text))
+            if not features.entities and words & FOLLOW_UP_WORDS[language]:
+                features.follow_up = session
+            else:
+                features.session_terms = [
+                    entity for entity in session.entities if entity not in features.key_terms
+                ]
+
+        return features
+
+    def related_fact_ids(self, features: QueryFeatures) -> List[str]:
+        """Facts not yet answered in a follow-up's session that share its entities"""
+        if not features.follow_up:
+            return []
+        session = features.follow_up
+        return [
+            fact_key for fact_key, keywords in self.fact_keywords[features.language]
+            if fact_key not in session.fact_ids
+            and any(entity in keyword for entity in session.entities for keyword in keywords)
+        ]
+
+    def session_characters(self, features: QueryFeatures) -> List[str]:
+        """Characters discussed earlier in the session of a follow-up question"""
+        if not features.follow_up:
+            return []
+        return [
+            name for entity in features.follow_up.entities
+            for name, name_lower in self.character_names[features.language]
+            if name_lower in entity
+        ]
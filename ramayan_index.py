@@ -0,0 +1,229 @@
+"""
+Ramayan Full Text Index
+Inverted index over the extracted corpora, built in parallel from page shards
+"""
+
+import argparse
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Page separators written by the PDF extraction ("--- Page 12 ---")
+PAGE_MARKER = re.compile(r"^--- Page \d+ ---$", re.MULTILINE)
+
+# Below this size a process pool costs more than it saves
+MIN_PARALLEL_CHARS = 200_000
+
+# Shards handed to each worker, so uneven pages still balance out
+SHARDS_PER_WORKER = 4
+
+Postings = Dict[str, List[int]]
+
+
+class FullTextIndex:
+    """Maps lowercased whitespace tokens to the sorted line numbers containing them"""
+
+    def __init__(self, postings: Postings, cache_size: int = 256):
+        self.postings = postings
+        # LRU of recent term lookups, a plain dict so memory profiling can walk it
+        self.cache_size = cache_size
+        self.cache: "OrderedDict[str, Optional[Tuple[int, ...]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def lines_with_term(self, term: str) -> Optional[Tuple[int, ...]]:
+        """Cached line numbers whose lowercased text contains the term"""
+        return self.lookup(term)[0]
+
+    def lookup(self, term: str) -> Tuple[Optional[Tuple[int, ...]], bool]:
+        """Line numbers for the term, and whether they came from the cache"""
+        with self._cache_lock:
+            if term in self.cache:
+                self.cache.move_to_end(term)
+                return self.cache[term], True
+
+        line_ids = self._lines_with_term(term)
+        with self._cache_lock:
+            self.cache[term] = line_ids
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return line_ids, False
+
+    def _lines_with_term(self, term: str) -> Optional[Tuple[int, ...]]:
+        """Line numbers whose lowercased text contains the term, in order
+
+        Same result as scanning ``term.lower() in line.lower()`` over every
+        line. Returns None for terms spanning whitespace, which the token
+        vocabulary cannot answer.
+        """
+        term = term.lower()
+        if not term or any(ch.isspace() for ch in term):
+            return None
+
+        # A term without whitespace can only occur inside a single token
+        line_ids = set()
+        for token, token_lines in self.postings.items():
+            if term in token:
+                line_ids.update(token_lines)
+        return tuple(sorted(line_ids))
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, FullTextIndex) and self.postings == other.postings
+
+
+def split_shards(text: str, shard_count: int) -> List[Tuple[int, str]]:
+    """Split text at page markers into about shard_count (first line number, text) shards"""
+    page_starts = [match.start() for match in PAGE_MARKER.finditer(text)]
+    if not page_starts or page_starts[0] != 0:
+        page_starts.insert(0, 0)
+
+    pages_per_shard = max(1, -(-len(page_starts) // max(1, shard_count)))
+    shard_starts = page_starts[::pages_per_shard]
+
+    shards = []
+    first_line = 0
+    for i, start in enumerate(shard_starts):
+        # Page markers begin a line, so drop the newline ending the previous shard
+        end = shard_starts[i + 1] - 1 if i + 1 < len(shard_starts) else len(text)
+        shards.append((first_line, text[start:end]))
+        first_line += text.count("\n", start, end) + 1
+    return shards
+
+
+def index_shard(shard: Tuple[int, str]) -> Postings:
+    """Tokenize one shard into postings with global line numbers"""
+    first_line, text = shard
+    postings: Postings = {}
+    for line_id, line in enumerate(text.split("\n"), first_line):
+        for token in set(line.lower().split()):
+            postings.setdefault(token, []).append(line_id)
+    return postings
+
+
+def merge_postings(shard_postings: Iterable[Postings]) -> Postings:
+    """Merge per-shard postings given in line order, keeping each list sorted"""
+    merged: Postings = {}
+    for postings in shard_postings:
+        for token, line_ids in postings.items():
+            existing = merged.get(token)
+            if existing is None:
+                merged[token] = line_ids
+            else:
+                existing.extend(line_ids)
+    return merged
+
+
+def default_workers() -> int:
+    """Worker count from RAMAYAN_INDEX_WORKERS, else the number of CPUs"""
+    workers = os.getenv("RAMAYAN_INDEX_WORKERS")
+    if workers:
+        return max(1, int(workers))
+    return os.cpu_count() or 1
+
+
+def build_indexes(
+    corpora: Dict[str, str],
+    workers: Optional[int] = None,
+    mp_context: Optional[BaseContext] = None
+) -> Dict[str, FullTextIndex]:
+    """Build one index per corpus, sharding every corpus by pages over a process pool
+
+    Workers started with spawn or forkserver re-import the main module, so
+    it must not build indexes at import time.
+    """
+    if workers is None:
+        workers = default_workers()
+
+    total_chars = sum(len(text) for text in corpora.values())
+    if workers <= 1 or total_chars < MIN_PARALLEL_CHARS:
+        return {name: FullTextIndex(index_shard((0, text))) for name, text in corpora.items()}
+
+    shard_names = []
+    shards = []
+    for name, text in corpora.items():
+        # Split work by corpus size so a small corpus does not get tiny shards
+        shard_count = max(1, round(workers * SHARDS_PER_WORKER * len(text) / total_chars))
+        for shard in split_shards(text, shard_count):
+            shard_names.append(name)
+            shards.append(shard)
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+        shard_postings = list(pool.map(index_shard, shards))
+
+    indexes = {}
+    for name in corpora:
+        indexes[name] = FullTextIndex(merge_postings(
+            postings for shard_name, postings in zip(shard_names, shard_postings) if shard_name == name
+        ))
+    return indexes
+
+
+def _timed_build(corpora: Dict[str, str], workers: int, repeat: int):
+    """Best build time over repeated runs, with the last build's indexes"""
+    best = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        indexes = build_indexes(corpora, workers=workers)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, indexes
+
+
+def benchmark_build(corpora: Dict[str, str], core_counts: Iterable[int], repeat: int = 3) -> List[Dict]:
+    """Time index builds per core count and check they match the single-threaded build"""
+    single_seconds, baseline = _timed_build(corpora, 1, repeat)
+
+    results = []
+    for workers in core_counts:
+        if workers == 1:
+            seconds, indexes = single_seconds, baseline
+        else:
+            seconds, indexes = _timed_build(corpora, workers, repeat)
+        results.append({
+            "workers": workers,
+            "seconds": round(seconds, 4),
+            "speedup": round(single_seconds / seconds, 2),
+            "identical": indexes == baseline
+        })
+    return results
+
+
+def main():
+    """Benchmark the parallel index build over the extracted corpora"""
+    parser = argparse.ArgumentParser(description="Benchmark parallel full text index builds")
+    parser.add_argument(
+        "files", nargs="*",
+        default=["रामचरितमानस_extracted.txt", "english_extracted.txt"],
+        help="extracted corpus files to index"
+    )
+    parser.add_argument(
+        "--cores", nargs="+", type=int,
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+        help="core counts to benchmark"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="runs per core count (best is reported)")
+    args = parser.parse_args()
+
+    corpora = {}
+    for filename in args.files:
+        if os.path.exists(filename):
+            with open(filename, "r", encoding="utf-8") as f:
+                corpora[filename] = f.read()
+        else:
+            print(f"📝 {filename} not found - skipping")
+    if not corpora:
+        print("❌ No corpus files to index.")
+        return
+
+    print(f"📚 Indexing {len(corpora)} corpora, {sum(len(t) for t in corpora.values()):,} characters")
+    print(f"{'cores':>6} {'seconds':>9} {'speedup':>8} {'identical':>10}")
+    for result in benchmark_build(corpora, args.cores, args.repeat):
+        print(f"{result['workers']:>6} {result['seconds']:>9} {result['speedup']:>8} {str(result['identical']):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Structured Request Logging
+Per-request JSON-lines records written off the event loop through a queue
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+logger = logging.getLogger("ramayan.requests")
+
+# Records waiting for the sink; beyond this they are dropped rather than blocking
+QUEUE_SIZE = 10000
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def new_request_id() -> str:
+    """Short random ID that ties a request's record to its response"""
+    return uuid.uuid4().hex[:16]
+
+
+class RequestTrace:
+    """Fields and stage timings collected while answering one request"""
+
+    def __init__(self, request_id: Optional[str] = None, **fields):
+        self.request_id = request_id or new_request_id()
+        self.fields = fields
+        self.timings: Dict[str, float] = {}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a block of work under the given stage name"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def to_dict(self) -> Dict:
+        record = {"request_id": self.request_id}
+        record.update(self.fields)
+        record["timings_ms"] = {name: round(ms, 3) for name, ms in self.timings.items()}
+        record["total_ms"] = round((time.perf_counter() - self._start) * 1000, 3)
+        return record
+
+
+def log_request(trace: RequestTrace):
+    """Emit the trace as one structured record, if request logging is enabled"""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("request", extra={"fields": trace.to_dict()})
+
+
+class SamplingFilter(logging.Filter):
+    """Keep a random fraction of records"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return self.rate >= 1.0 or random.random() < self.rate
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per line, with the record's structured fields inlined"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "event": record.getMessage()
+        }
+        entry.update(getattr(record, "fields", {}))
+        return json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that never blocks the caller, counting records it had to drop"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_request_logging(sample_rate: Optional[float] = None, log_file: Optional[str] = None):
+    """Route request records through a background queue to a JSON-lines sink
+
+    Defaults come from RAMAYAN_LOG_SAMPLE_RATE (1.0 logs every request,
+    0 disables logging) and RAMAYAN_LOG_FILE (stdout when unset).
+    """
+    global _listener
+
+    if sample_rate is None:
+        sample_rate = float(os.getenv("RAMAYAN_LOG_SAMPLE_RATE", "1.0"))
+    if log_file is None:
+        log_file = os.getenv("RAMAYAN_LOG_FILE")
+
+    shutdown_request_logging()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.propagate = False
+
+    if sample_rate <= 0:
+        logger.setLevel(logging.CRITICAL + 1)
+        return
+    logger.setLevel(logging.INFO)
+
+    if log_file:
+        sink = logging.FileHandler(log_file, encoding="utf-8")
+    else:
+        sink = logging.StreamHandler(sys.stdout)
+    sink.setFormatter(JsonLinesFormatter())
+
+    queue_handler = DroppingQueueHandler(queue.Queue(QUEUE_SIZE))
+    queue_handler.addFilter(SamplingFilter(sample_rate))
+    logger.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(queue_handler.queue, sink)
+    _listener.start()
+
+
+def shutdown_request_logging():
+    """Flush queued records and stop the background writer"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_request_logging)
@@ -0,0 +1,87 @@
+"""
+Search Result Store
+Short-lived ranked result sets addressed by opaque pagination cursors
+"""
+
+import base64
+import secrets
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+
+class ResultSet:
+    """Ranked line numbers of one full text search"""
+
+    __slots__ = ("language", "key_terms", "line_ids", "scores", "data_version", "created")
+
+    def __init__(self, language: str, key_terms: List[str], ranked: List[Tuple[int, int]], data_version: int):
+        self.language = language
+        self.key_terms = key_terms
+        # Compact arrays, a popular term can match thousands of lines
+        self.line_ids = array("i", (line_id for line_id, _ in ranked))
+        self.scores = array("b", (min(score, 127) for _, score in ranked))
+        self.data_version = data_version
+        self.created = time.monotonic()
+
+
+class SearchResultStore:
+    """LRU store of result sets that expire a fixed time after the search"""
+
+    def __init__(self, max_results: int = 1000, ttl: float = 10 * 60):
+        self.max_results = max_results
+        self.ttl = ttl
+        self._results: "OrderedDict[str, ResultSet]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, result_set: ResultSet) -> str:
+        """Store a result set and return its ID"""
+        result_id = secrets.token_urlsafe(12)
+        with self._lock:
+            self._results[result_id] = result_set
+            self._evict()
+        return result_id
+
+    def get(self, result_id: str) -> Optional[ResultSet]:
+        """Return a live result set, or None if unknown or expired"""
+        with self._lock:
+            result_set = self._results.get(result_id)
+            if result_set is None:
+                return None
+            if time.monotonic() - result_set.created > self.ttl:
+                del self._results[result_id]
+                return None
+            self._results.move_to_end(result_id)
+            return result_set
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def _evict(self):
+        """Drop expired result sets, then least recently used ones over the limit"""
+        now = time.monotonic()
+        expired = [key for key, value in self._results.items() if now - value.created > self.ttl]
+        for key in expired:
+            del self._results[key]
+        while len(self._results) > self.max_results:
+            self._results.popitem(last=False)
+
+
+def encode_cursor(result_id: str, offset: int) -> str:
+    """Opaque cursor pointing at an offset of a stored result set"""
+    return base64.urlsafe_b64encode(f"{result_id}:{offset}".encode("ascii")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """Split a cursor into result set ID and offset, raising ValueError if malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        result_id, offset = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii").rsplit(":", 1)
+        offset = int(offset)
+    except (UnicodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+    if offset < 0:
+        raise ValueError("Invalid cursor")
+    return result_id, offset
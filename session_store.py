@@ -0,0 +1,146 @@
+"""
+Conversation Session Store
+Memory-bounded LRU store of compact per-session state for follow-up questions
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, List, Optional
+
+
+class SessionState:
+    """Compact conversational state kept between questions of one session"""
+
+    __slots__ = ("language", "entities", "fact_ids", "chunk_ids", "last_seen", "size_bytes")
+
+    def __init__(self, language: str = ""):
+        self.language = language
+        self.entities: List[str] = []    # Most recent first
+        self.fact_ids: List[str] = []    # Story facts already answered, most recent first
+        self.chunk_ids: List[int] = []   # Line numbers of matched full text passages
+        self.last_seen = time.monotonic()
+        self.size_bytes = 0
+
+    def estimate_size(self) -> int:
+        """Approximate memory held by this state, in bytes"""
+        size = sys.getsizeof(self) + sys.getsizeof(self.language)
+        for values in (self.entities, self.fact_ids, self.chunk_ids):
+            size += sys.getsizeof(values) + sum(sys.getsizeof(value) for value in values)
+        return size
+
+
+class SessionStore:
+    """LRU session store bounded by session count, total bytes and idle time"""
+
+    def __init__(
+        self,
+        max_sessions: int = 10000,
+        max_bytes: int = 16 * 1024 * 1024,
+        idle_ttl: float = 30 * 60,
+        max_entities: int = 6,
+        max_fact_ids: int = 4,
+        max_chunk_ids: int = 16
+    ):
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.idle_ttl = idle_ttl
+        self.max_entities = max_entities
+        self.max_fact_ids = max_fact_ids
+        self.max_chunk_ids = max_chunk_ids
+
+        self._sessions: "OrderedDict[str, SessionState]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[SessionState]:
+        """Return the live state for a session, or None if unknown or idle-expired"""
+        with self._lock:
+            state = self._sessions.get(session_id)
+            if state is None:
+                return None
+
+            now = time.monotonic()
+            if now - state.last_seen > self.idle_ttl:
+                self._remove(session_id)
+                return None
+
+            state.last_seen = now
+            self._sessions.move_to_end(session_id)
+            return state
+
+    def update(
+        self,
+        session_id: str,
+        language: str,
+        entities: Iterable[str] = (),
+        fact_ids: Iterable[str] = (),
+        chunk_ids: Iterable[int] = ()
+    ) -> SessionState:
+        """Record the outcome of a question, creating the session if needed"""
+        with self._lock:
+            state = self._sessions.get(session_id)
+            if state is None:
+                state = SessionState(language)
+                self._sessions[session_id] = state
+            else:
+                self._total_bytes -= state.size_bytes
+                self._sessions.move_to_end(session_id)
+
+            state.language = language
+            state.entities = self._merge_recent(entities, state.entities, self.max_entities)
+            fact_ids = list(fact_ids)
+            if fact_ids:
+                state.fact_ids = self._merge_recent(fact_ids, state.fact_ids, self.max_fact_ids)
+            # Chunks describe the latest answer only, older positions are stale
+            state.chunk_ids = list(chunk_ids)[:self.max_chunk_ids]
+            state.last_seen = time.monotonic()
+
+            state.size_bytes = state.estimate_size() + sys.getsizeof(session_id)
+            self._total_bytes += state.size_bytes
+            self._evict()
+            return state
+
+    def stats(self) -> dict:
+        """Current occupancy of the store"""
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "total_bytes": self._total_bytes,
+                "max_sessions": self.max_sessions,
+                "max_bytes": self.max_bytes,
+                "idle_ttl_seconds": self.idle_ttl
+            }
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _merge_recent(self, new_values: Iterable, old_values: List, limit: int) -> List:
+        """Put new values first, keep older ones after them, drop duplicates"""
+        merged = []
+        for value in list(new_values) + old_values:
+            if value not in merged:
+                merged.append(value)
+            if len(merged) >= limit:
+                break
+        return merged
+
+    def _remove(self, session_id: str):
+        state = self._sessions.pop(session_id)
+        self._total_bytes -= state.size_bytes
+
+    def _evict(self):
+        """Drop idle sessions, then least recently used ones until within bounds"""
+        now = time.monotonic()
+        # Oldest sessions sit at the front, so stop at the first live one
+        while self._sessions:
+            session_id, state = next(iter(self._sessions.items()))
+            if now - state.last_seen <= self.idle_ttl:
+                break
+            self._remove(session_id)
+
+        while self._sessions and (
+            len(self._sessions) > self.max_sessions or self._total_bytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._sessions)))
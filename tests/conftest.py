@@ -0,0 +1,85 @@
+import json
+import os
+import sys
+
+import pytest
+
+# The modules live at the repository root, next to the server
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+ENGLISH_DATA = {
+    "english_story_facts": {
+        "sita_location": {
+            "question_keywords": ["sita", "ravana", "ashoka", "garden"],
+            "answer": "Ravana kept Sita in the Ashoka garden in Lanka."
+        },
+        "ravana_death": {
+            "question_keywords": ["ravana death", "battle"],
+            "answer": "Rama killed Ravana in the final battle."
+        }
+    },
+    "characters_english": {
+        "Hanuman": {"description": "Devoted servant of Rama", "qualities": ["Devotion", "Strength"]}
+    },
+    "teachings": {"dharma": {"definition": "Righteous duty"}}
+}
+
+HINDI_DATA = {
+    "story_facts": {
+        "राम_जन्म": {"question_keywords": ["जन्म"], "answer": "राम का जन्म अयोध्या में हुआ।"}
+    },
+    "characters": {"हनुमान": {"qualities": ["भक्ति"]}}
+}
+
+
+def english_corpus(pages: int = 30, lines_per_page: int = 20) -> str:
+    """Extracted text with page markers; every 10th line names Hanuman, every 15th Lanka"""
+    lines = []
+    for page in range(1, pages + 1):
+        lines.append(f"--- Page {page} ---")
+        for _ in range(lines_per_page):
+            number = len(lines)
+            words = [f"verse {number}"]
+            if number % 10 == 0:
+                words.append("Hanuman")
+            if number % 15 == 0:
+                words.append("Lanka")
+            lines.append(" ".join(words))
+    return "\n".join(lines)
+
+
+@pytest.fixture
+def training_dir(tmp_path, monkeypatch):
+    """Working directory with small training files; the chatbot loads them from the CWD"""
+    (tmp_path / "english_training_data.json").write_text(json.dumps(ENGLISH_DATA), encoding="utf-8")
+    (tmp_path / "fully_enhanced_training_data.json").write_text(
+        json.dumps(HINDI_DATA, ensure_ascii=False), encoding="utf-8"
+    )
+    (tmp_path / "english_extracted.txt").write_text(english_corpus(), encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("RAMAYAN_LOG_SAMPLE_RATE", "0")
+    monkeypatch.setenv("RAMAYAN_INDEX_WORKERS", "1")
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def chatbot(training_dir):
+    pytest.importorskip("google.generativeai")
+    from enhanced_ramayan_chatbot import EnhancedRamayanChatbot
+    return EnhancedRamayanChatbot()
+
+
+@pytest.fixture
+def client(training_dir, monkeypatch):
+    """Test client of a started server, with the admin token set to "secret" """
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    pytest.importorskip("google.generativeai")
+    from fastapi.testclient import TestClient
+    import bilingual_ramayan_server
+
+    monkeypatch.setattr(bilingual_ramayan_server, "ADMIN_TOKEN", "secret")
+    with TestClient(bilingual_ramayan_server.app) as test_client:
+        yield test_client
@@ -0,0 +1,30 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("google.generativeai")
+
+
+def test_admin_endpoints_need_the_token(client):
+    assert client.get("/admin/profile/cpu").status_code == 403
+    assert client.get("/admin/profile/cpu", headers={"X-Admin-Token": "wrong"}).status_code == 403
+
+
+def test_cpu_status_reports_strategy_counts(client):
+    answered_by = [
+        client.post("/ask-bilingual", json={"question": question}).json()["answered_by"]
+        for question in ("Where did Ravana keep Sita?", "Tell me about Hanuman", "Where is Lanka?", "Who is Hanuman?")
+    ]
+
+    status = client.get("/admin/profile/cpu", headers={"X-Admin-Token": "secret"}).json()
+
+    assert answered_by == ["specific_fact", "character", "full_text", "character"]
+    assert status["strategy_counts"] == {"specific_fact": 1, "character": 2, "full_text": 1}
+
+
+def test_memory_report_includes_session_occupancy(client):
+    client.post("/ask-bilingual", json={"question": "Tell me about Hanuman", "session_id": "s1"})
+
+    report = client.get("/admin/profile/memory", params={"estimate": False}, headers={"X-Admin-Token": "secret"}).json()
+
+    assert report["sessions"]["sessions"] == 1
+    assert 0 < report["sessions"]["total_bytes"] <= report["sessions"]["max_bytes"]
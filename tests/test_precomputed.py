@@ -0,0 +1,71 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("google.generativeai")
+
+from bilingual_ramayan_server import _accepts_gzip
+
+ENDPOINTS = ["/training-status", "/sample-questions-bilingual", "/language-comparison", "/health-bilingual"]
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", True),
+    ("gzip, deflate, br", True),
+    ("deflate;q=0.5, GZIP;q=0.8", True),
+    ("gzip;q=0", False),
+    ("gzip; q=0.0, deflate", False),
+    ("*", True),
+    ("*;q=0", False),
+    ("gzip;q=0, *", False),
+    ("identity", False),
+    ("", False)
+])
+def test_accept_encoding_q_values(header, expected):
+    assert _accepts_gzip(header) is expected
+
+
+@pytest.mark.parametrize("path", ENDPOINTS)
+def test_representations_have_own_etags_and_revalidate(client, path):
+    plain = client.get(path, headers={"Accept-Encoding": "identity"})
+    gzipped = client.get(path, headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in plain.headers
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.json() == plain.json()
+    for response in (plain, gzipped):
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.headers["cache-control"] == "no-cache"
+    assert plain.headers["etag"].startswith('"') and plain.headers["etag"].endswith('"')
+    assert gzipped.headers["etag"] == plain.headers["etag"][:-1] + '-gz"'
+
+    for encoding, response in (("identity", plain), ("gzip", gzipped)):
+        revalidated = client.get(path, headers={
+            "Accept-Encoding": encoding, "If-None-Match": response.headers["etag"]
+        })
+        assert revalidated.status_code == 304
+        assert revalidated.headers["etag"] == response.headers["etag"]
+        assert revalidated.content == b""
+
+    stale = client.get(path, headers={"Accept-Encoding": "identity", "If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+
+
+def test_gzip_refused_with_zero_quality(client):
+    response = client.get("/health-bilingual", headers={"Accept-Encoding": "gzip;q=0"})
+
+    assert "content-encoding" not in response.headers
+    assert not response.headers["etag"].endswith('-gz"')
+
+
+def test_reload_changes_etag(client, training_dir):
+    before = client.get("/training-status", headers={"Accept-Encoding": "identity"})
+    with open(training_dir / "english_extracted.txt", "a", encoding="utf-8") as f:
+        f.write("\nverse added after startup")
+
+    assert client.post("/reload-training", headers={"X-Admin-Token": "secret"}).status_code == 200
+    after = client.get("/training-status", headers={
+        "Accept-Encoding": "identity", "If-None-Match": before.headers["etag"]
+    })
+
+    assert after.status_code == 200
+    assert after.headers["etag"] != before.headers["etag"]
@@ -0,0 +1,79 @@
+import concurrent.futures.process
+import multiprocessing.connection
+import os
+import threading
+import tracemalloc
+
+import pytest
+
+import profiling
+from conftest import english_corpus
+from ramayan_index import FullTextIndex, index_shard
+
+
+def test_memory_tracing_starts_only_when_enabled(monkeypatch):
+    monkeypatch.delenv("RAMAYAN_TRACEMALLOC", raising=False)
+    assert not profiling.start_memory_tracing_from_env()
+    assert not tracemalloc.is_tracing()
+
+    monkeypatch.setenv("RAMAYAN_TRACEMALLOC", "1")
+    monkeypatch.setenv("RAMAYAN_TRACEMALLOC_FRAMES", "5")
+    try:
+        assert profiling.start_memory_tracing_from_env()
+        assert tracemalloc.get_traceback_limit() == 5
+    finally:
+        profiling.stop_memory_tracing()
+
+
+def test_postings_unpickled_from_index_workers_count_as_indexes():
+    pytest.importorskip("google.generativeai")
+    pool_dir = os.path.dirname(concurrent.futures.process.__file__)
+    connection = multiprocessing.connection.__file__
+    # Most recent frame first: the executor's result thread receiving a shard's postings
+    traceback = tracemalloc.Traceback((
+        (connection, 251),
+        (os.path.join(pool_dir, "process.py"), 399),
+        (threading.__file__, 1038)
+    ))
+
+    assert profiling._component_of(traceback, profiling._function_lines()) == "indexes"
+
+
+def test_term_cache_is_attributed_to_caches():
+    index = FullTextIndex(index_shard((0, english_corpus())))
+    profiling.start_memory_tracing(25)
+    try:
+        for number in range(100):
+            index.lines_with_term(str(number))
+        report = profiling.memory_snapshot()
+    finally:
+        profiling.stop_memory_tracing()
+
+    components = report["components"]
+    assert components["caches"]["bytes"] > components.get("indexes", {}).get("bytes", 0)
+
+
+def test_estimate_counts_term_cache_and_extra_caches(chatbot):
+    before = profiling.component_sizes(chatbot)
+    for term in ("hanuman", "lanka", "verse"):
+        chatbot.corpora.indexes["english"].lines_with_term(term)
+    precomputed = {"health": b"x" * 10000}
+
+    after = profiling.component_sizes(chatbot, [precomputed])
+
+    assert after["caches"] > before["caches"] + 10000
+    assert after["indexes"] == before["indexes"]
+
+
+def test_precomputed_responses_are_attributed_to_caches(client):
+    import bilingual_ramayan_server
+
+    bilingual_ramayan_server._precomputed.clear()
+    profiling.start_memory_tracing(25)
+    try:
+        body = client.get("/sample-questions-bilingual").content
+        report = profiling.memory_snapshot()
+    finally:
+        profiling.stop_memory_tracing()
+
+    assert report["components"]["caches"]["bytes"] > len(body)
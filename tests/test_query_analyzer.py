@@ -0,0 +1,50 @@
+from query_analyzer import QueryAnalyzer
+from session_store import SessionState
+
+
+def make_session(*entities: str) -> SessionState:
+    session = SessionState("english")
+    session.entities = list(entities)
+    return session
+
+
+def test_pronoun_question_is_a_follow_up():
+    analyzer = QueryAnalyzer({}, {})
+
+    features = analyzer.analyze("What did he do next?", "english", make_session("hanuman"))
+
+    assert features.follow_up is not None
+    assert features.session_terms == []
+
+
+def test_hindi_pronoun_question_is_a_follow_up():
+    analyzer = QueryAnalyzer({}, {})
+
+    features = analyzer.analyze("उसने आगे क्या किया?", "hindi", make_session("हनुमान"))
+
+    assert features.follow_up is not None
+
+
+def test_new_question_keeps_its_terms_and_adds_session_entities():
+    analyzer = QueryAnalyzer({}, {})
+
+    features = analyzer.analyze("Describe the great battle", "english", make_session("hanuman", "lanka"))
+
+    assert features.follow_up is None
+    assert features.key_terms == ["describe", "great", "battle"]
+    assert features.session_terms == ["hanuman", "lanka"]
+
+
+def test_related_facts_skip_facts_already_answered():
+    english_data = {"english_story_facts": {
+        "sita_location": {"question_keywords": ["sita", "ravana", "lanka"]},
+        "exile_reason": {"question_keywords": ["exile", "kaikeyi"]},
+        "ravana_death": {"question_keywords": ["ravana death", "battle"]}
+    }}
+    analyzer = QueryAnalyzer({}, english_data)
+    session = make_session("ravana", "sita")
+    session.fact_ids = ["sita_location"]
+
+    features = analyzer.analyze("What happened next?", "english", session)
+
+    assert analyzer.related_fact_ids(features) == ["ravana_death"]
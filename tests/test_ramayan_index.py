@@ -0,0 +1,67 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from conftest import REPO_ROOT
+from ramayan_index import MIN_PARALLEL_CHARS, build_indexes
+
+
+def make_corpus(min_chars: int = MIN_PARALLEL_CHARS) -> str:
+    """Synthetic extracted text with page markers, large enough to build in parallel"""
+    pages = []
+    page = 1
+    while sum(len(p) for p in pages) < min_chars:
+        lines = [f"--- Page {page} ---"]
+        lines += [f"Rama went to Lanka with Hanuman, verse {page}-{i}" for i in range(40)]
+        pages.append("\n".join(lines))
+        page += 1
+    return "\n".join(pages)
+
+
+def test_spawn_build_matches_single_worker_build():
+    corpora = {"english": make_corpus(), "hindi": "राम ने लंका में प्रवेश किया\nसीता अशोक वाटिका में"}
+    expected = build_indexes(corpora, workers=1)
+
+    indexes = build_indexes(corpora, workers=2, mp_context=multiprocessing.get_context("spawn"))
+
+    assert indexes == expected
+    assert indexes["english"].lines_with_term("hanuman") == expected["english"].lines_with_term("hanuman")
+
+
+def test_server_starts_with_spawned_index_workers(tmp_path):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    pytest.importorskip("google.generativeai")
+
+    (tmp_path / "english_extracted.txt").write_text(make_corpus(), encoding="utf-8")
+    # Spawned workers re-import this main module, and with it the server module
+    (tmp_path / "serve.py").write_text(textwrap.dedent("""
+        import multiprocessing
+
+        # The default start method on macOS and Windows
+        multiprocessing.set_start_method("spawn", force=True)
+
+        from fastapi.testclient import TestClient
+
+        import bilingual_ramayan_server
+
+        if __name__ == "__main__":
+            with TestClient(bilingual_ramayan_server.app) as client:
+                response = client.get("/health-bilingual")
+                assert response.status_code == 200
+                assert bilingual_ramayan_server.chatbot.corpora.indexes["english"].postings
+            print("started")
+    """), encoding="utf-8")
+
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT, RAMAYAN_INDEX_WORKERS="2", RAMAYAN_LOG_SAMPLE_RATE="0")
+    result = subprocess.run(
+        [sys.executable, "serve.py"], cwd=tmp_path, env=env,
+        capture_output=True, text=True, timeout=300
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "started" in result.stdout
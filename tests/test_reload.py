@@ -0,0 +1,24 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("google.generativeai")
+
+import bilingual_ramayan_server
+
+
+def test_reload_requires_admin_token(client):
+    assert client.post("/reload-training").status_code == 403
+    assert client.post("/reload-training", headers={"X-Admin-Token": "wrong"}).status_code == 403
+
+
+def test_reload_swaps_in_new_corpora(client):
+    chatbot = bilingual_ramayan_server.chatbot
+    before = chatbot.corpora
+
+    response = client.post("/reload-training", headers={"X-Admin-Token": "secret"})
+
+    assert response.json() == {"reloaded": True, "data_version": before.data_version + 1}
+    assert chatbot.corpora is not before
+    # A request that started before the reload keeps a complete snapshot
+    assert before.analyzer is not chatbot.corpora.analyzer
+    assert before.indexes and before.lines
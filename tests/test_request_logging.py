@@ -0,0 +1,89 @@
+import json
+import logging
+import queue
+import random
+import time
+
+import pytest
+
+import request_logging
+from request_logging import (
+    DroppingQueueHandler, RequestTrace, SamplingFilter, configure_request_logging, log_request
+)
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """Log every request to a file, restoring disabled logging afterwards"""
+    path = tmp_path / "requests.jsonl"
+    configure_request_logging(sample_rate=1.0, log_file=str(path))
+    yield path
+    configure_request_logging(sample_rate=0)
+
+
+def read_records(path) -> list:
+    request_logging.shutdown_request_logging()  # Flushes the queue
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_answer_record_has_required_fields(chatbot, log_file):
+    first = chatbot.answer_question("Where is Lanka?", request_id="req-1")
+    chatbot.answer_question("Where is Lanka?", request_id="req-2")
+    chatbot.answer_question("Tell me about Hanuman", request_id="req-3")
+
+    records = read_records(log_file)
+
+    assert [record["request_id"] for record in records] == ["req-1", "req-2", "req-3"]
+    for record in records:
+        assert {"request_id", "language", "stage", "cache_hit", "timings_ms", "total_ms"} <= record.keys()
+        assert "question" not in record
+    assert first["strategy"] == records[0]["stage"] == "full_text"
+    assert "full_text" in records[0]["timings_ms"]
+    # The second identical search is served from the term cache
+    assert [record["cache_hit"] for record in records] == [False, True, None]
+
+
+def test_zero_sample_rate_disables_logging(tmp_path):
+    path = tmp_path / "requests.jsonl"
+    configure_request_logging(sample_rate=0, log_file=str(path))
+
+    log_request(RequestTrace("req-1"))
+
+    assert not request_logging.logger.isEnabledFor(logging.INFO)
+    assert not request_logging.logger.handlers
+    assert not path.exists()
+
+
+def test_sample_rate_read_from_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("RAMAYAN_LOG_SAMPLE_RATE", "0.25")
+    configure_request_logging(log_file=str(tmp_path / "requests.jsonl"))
+    try:
+        (handler,) = request_logging.logger.handlers
+        (sampling,) = handler.filters
+        assert sampling.rate == 0.25
+    finally:
+        configure_request_logging(sample_rate=0)
+
+
+def test_fractional_rate_keeps_that_share_of_records():
+    random.seed(1234)
+    sampling = SamplingFilter(0.25)
+    record = logging.LogRecord("ramayan.requests", logging.INFO, __file__, 0, "request", None, None)
+
+    kept = sum(sampling.filter(record) for _ in range(10000))
+
+    assert 2300 < kept < 2700
+    assert all(SamplingFilter(1.0).filter(record) for _ in range(100))
+
+
+def test_full_queue_drops_records_without_blocking():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+    record = logging.LogRecord("ramayan.requests", logging.INFO, __file__, 0, "request", None, None)
+
+    start = time.perf_counter()
+    for _ in range(5):
+        handler.handle(record)
+
+    assert time.perf_counter() - start < 1
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
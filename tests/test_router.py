@@ -0,0 +1,42 @@
+import pytest
+
+STRUCTURED = [
+    ("Where did Ravana keep Sita?", "specific_fact"),
+    ("Tell me about Hanuman", "character"),
+    ("What does dharma mean?", "teachings"),
+    ("राम का जन्म कैसे हुआ?", "specific_fact")
+]
+
+
+@pytest.mark.parametrize("question, strategy", STRUCTURED)
+def test_structured_answers_never_search_the_full_text(chatbot, monkeypatch, question, strategy):
+    def search_full_text(*args, **kwargs):
+        raise AssertionError("searched the full text")
+    monkeypatch.setattr(chatbot, "_search_full_text", search_full_text)
+
+    result = chatbot.answer_question(question)
+
+    assert result["strategy"] == strategy
+    assert chatbot.strategy_stats() == {strategy: 1}
+
+
+def test_every_strategy_is_counted(chatbot):
+    questions = [question for question, _ in STRUCTURED] + [
+        "Where is Lanka?",                  # Full text only
+        "What is the meaning of life?"      # Nothing matches
+    ]
+
+    answered_by = [chatbot.answer_question(question)["strategy"] for question in questions]
+
+    assert answered_by == ["specific_fact", "character", "teachings", "specific_fact", "full_text", "contextual"]
+    assert chatbot.strategy_stats() == {
+        "specific_fact": 2, "character": 1, "teachings": 1, "full_text": 1, "contextual": 1
+    }
+
+
+def test_follow_ups_use_session_strategies(chatbot):
+    chatbot.answer_question("Where did Ravana keep Sita?", "s1")
+
+    assert chatbot.answer_question("What happened next?", "s1")["strategy"] == "session_fact"
+    assert chatbot.answer_question("Where is Lanka?", "s1")["strategy"] == "full_text"
+    assert chatbot.answer_question("What did they do next?", "s1")["strategy"] == "full_text"
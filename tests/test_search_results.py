@@ -0,0 +1,107 @@
+import pytest
+
+import search_results
+from search_results import ResultSet, SearchResultStore, decode_cursor, encode_cursor
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(search_results.time, "monotonic", fake)
+    return fake
+
+
+def make_result_set(data_version: int = 1) -> ResultSet:
+    return ResultSet("english", ["hanuman"], [(10, 2), (20, 1)], data_version)
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor("abc_-123", 40)) == ("abc_-123", 40)
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor!", encode_cursor("abc", 0)[:-2] + "$$", "YWJj", encode_cursor("abc", -1)])
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_store_evicts_least_recently_used(clock):
+    store = SearchResultStore(max_results=2)
+    first = store.add(make_result_set())
+    second = store.add(make_result_set())
+    store.get(first)
+
+    third = store.add(make_result_set())
+
+    assert store.get(second) is None
+    assert store.get(first) is not None
+    assert store.get(third) is not None
+    assert len(store) == 2
+
+
+def test_store_expires_result_sets_after_ttl(clock):
+    store = SearchResultStore(ttl=60)
+    old = store.add(make_result_set())
+    clock.now += 30
+    recent = store.add(make_result_set())
+
+    clock.now += 31
+    assert store.get(old) is None
+    assert store.get(recent) is not None
+
+    # Expired sets are dropped on the next add even if never read again
+    clock.now += 60
+    store.add(make_result_set())
+    assert len(store) == 1
+
+
+def test_pages_follow_cursors_until_the_last(chatbot, monkeypatch):
+    first = chatbot.search_passages("Hanuman", "english", page_size=20)
+    assert first["total"] > 20 and len(first["passages"]) == 20
+    assert [p["rank"] for p in first["passages"]] == list(range(1, 21))
+
+    # Later pages come from the stored result set, not a new ranking
+    def rank_again(*args, **kwargs):
+        raise AssertionError("ranked again")
+    monkeypatch.setattr(chatbot, "_rank_passages", rank_again)
+
+    seen = [p["line"] for p in first["passages"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = chatbot.search_passages(cursor=cursor, page_size=20)
+        seen += [p["line"] for p in page["passages"]]
+        cursor = page["next_cursor"]
+
+    assert page["next_cursor"] is None
+    assert len(seen) == len(set(seen)) == first["total"]
+
+
+def test_reload_expires_cursors(chatbot):
+    first = chatbot.search_passages("Hanuman", "english", page_size=5)
+
+    chatbot.reload_training_data()
+
+    with pytest.raises(ValueError, match="expired"):
+        chatbot.search_passages(cursor=first["next_cursor"])
+
+
+def test_bad_cursors_are_client_errors(client):
+    first = client.post("/search-passages", json={"query": "Hanuman", "language": "english", "page_size": 5}).json()
+
+    page = client.post("/search-passages", json={"cursor": first["next_cursor"], "page_size": 5})
+    assert page.status_code == 200
+    assert page.json()["passages"][0]["rank"] == 6
+
+    assert client.post("/search-passages", json={"cursor": "garbage!"}).status_code == 400
+    unknown = client.post("/search-passages", json={"cursor": encode_cursor("unknown", 5)})
+    assert unknown.status_code == 400
+    assert "expired" in unknown.json()["detail"]
+    assert client.post("/search-passages", json={}).status_code == 400
@@ -0,0 +1,96 @@
+import sys
+
+import pytest
+
+import session_store
+from session_store import SessionStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(session_store.time, "monotonic", fake)
+    return fake
+
+
+def assert_total_bytes_consistent(store: SessionStore):
+    states = store._sessions
+    assert store._total_bytes == sum(state.size_bytes for state in states.values())
+    for session_id, state in states.items():
+        assert state.size_bytes == state.estimate_size() + sys.getsizeof(session_id)
+
+
+def test_least_recently_used_session_is_evicted_over_max_sessions(clock):
+    store = SessionStore(max_sessions=2)
+    store.update("a", "english", entities=["rama"])
+    store.update("b", "english", entities=["sita"])
+    store.get("a")
+
+    store.update("c", "english", entities=["hanuman"])
+
+    assert store.get("b") is None
+    assert store.get("a").entities == ["rama"]
+    assert store.get("c") is not None
+    assert_total_bytes_consistent(store)
+
+
+def test_sessions_are_evicted_to_stay_within_max_bytes(clock):
+    probe = SessionStore()
+    one_session = probe.update("s0", "english", entities=["rama"], chunk_ids=[1, 2, 3]).size_bytes
+    store = SessionStore(max_bytes=one_session * 3 + one_session // 2)
+
+    for number in range(10):
+        store.update(f"s{number}", "english", entities=["rama"], chunk_ids=[1, 2, 3])
+
+    assert len(store) == 3
+    assert store.stats()["total_bytes"] <= store.max_bytes
+    assert [store.get(f"s{number}") is not None for number in (6, 7, 8, 9)] == [False, True, True, True]
+    assert_total_bytes_consistent(store)
+
+
+def test_idle_session_expires_on_get(clock):
+    store = SessionStore(idle_ttl=60)
+    store.update("a", "english", entities=["rama"])
+
+    clock.now += 59
+    assert store.get("a") is not None  # Reading refreshes the idle timer
+    clock.now += 61
+
+    assert store.get("a") is None
+    assert len(store) == 0
+    assert store.stats()["total_bytes"] == 0
+
+
+def test_idle_sessions_are_evicted_by_later_updates(clock):
+    store = SessionStore(idle_ttl=60)
+    store.update("a", "english")
+    clock.now += 30
+    store.update("b", "english")
+    clock.now += 31
+
+    store.update("c", "english")
+
+    assert list(store._sessions) == ["b", "c"]
+    assert_total_bytes_consistent(store)
+
+
+def test_total_bytes_tracks_updates_of_existing_sessions(clock):
+    store = SessionStore(max_entities=3, max_fact_ids=2, max_chunk_ids=4)
+    store.update("a", "english", entities=["rama"], chunk_ids=list(range(10)))
+    store.update("a", "english", entities=["sita", "ravana", "lanka"], fact_ids=["sita_location"])
+    state = store.update("a", "english", entities=["rama"], fact_ids=["ravana_death"], chunk_ids=[5])
+
+    assert state.entities == ["rama", "sita", "ravana"]
+    assert state.fact_ids == ["ravana_death", "sita_location"]
+    # Chunks describe the latest answer only
+    assert state.chunk_ids == [5]
+    assert store.stats()["sessions"] == 1
+    assert_total_bytes_consistent(store)
@@ -0,0 +1,62 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+pytest.importorskip("google.generativeai")
+
+from fastapi.testclient import TestClient
+
+import bilingual_ramayan_server
+
+
+def receive_until_done(websocket, count: int) -> dict:
+    """Collect message types per question ID until count questions are done"""
+    received = {}
+    done = 0
+    while done < count:
+        message = websocket.receive_json()
+        received.setdefault(message["id"], []).append(message["type"])
+        if message["type"] in ("done", "error"):
+            done += 1
+    return received
+
+
+def test_pipelined_questions_are_answered_concurrently(monkeypatch):
+    with TestClient(bilingual_ramayan_server.app) as client:
+        threads = set()
+
+        def slow_answer(question, session_id=None, request_id=None, log_fields=None):
+            threads.add(threading.get_ident())
+            time.sleep(0.5)
+            return {"answer": f"{question}\n\nJai Shri Ram!", "language": "english",
+                    "strategy": "contextual", "request_id": request_id}
+
+        monkeypatch.setattr(bilingual_ramayan_server.chatbot, "answer_question", slow_answer)
+
+        with client.websocket_connect("/ws-bilingual") as websocket:
+            start = time.perf_counter()
+            for i in range(bilingual_ramayan_server.WS_MAX_CONCURRENT):
+                websocket.send_json({"id": str(i), "question": f"Question {i}"})
+            received = receive_until_done(websocket, bilingual_ramayan_server.WS_MAX_CONCURRENT)
+            elapsed = time.perf_counter() - start
+
+    assert all(types == ["start", "chunk", "chunk", "done"] for types in received.values())
+    assert len(threads) > 1
+    assert elapsed < 0.5 * bilingual_ramayan_server.WS_MAX_CONCURRENT
+
+
+def test_failed_question_reports_an_error(monkeypatch):
+    with TestClient(bilingual_ramayan_server.app) as client:
+        def failing_answer(*args, **kwargs):
+            raise RuntimeError("index unavailable")
+
+        monkeypatch.setattr(bilingual_ramayan_server.chatbot, "answer_question", failing_answer)
+
+        with client.websocket_connect("/ws-bilingual") as websocket:
+            websocket.send_json({"id": "1", "question": "Who is Rama?"})
+            message = websocket.receive_json()
+
+    assert message == {"id": "1", "type": "error", "detail": "index unavailable"}